@@ -11,17 +11,6 @@ import time
 from pathlib import Path
 
 
-def run_command(cmd, shell=True, capture_output=True):
-    """执行系统命令"""
-    try:
-        result = subprocess.run(
-            cmd, shell=shell, capture_output=capture_output, text=True
-        )
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
-
-
 def manual_run():
     """手动执行一次爬虫"""
     print("🔄 手动执行爬虫...")
@@ -1,12 +1,12 @@
 # coding=utf-8
 
-import json
 import os
 import random
 import re
 import time
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 
@@ -17,17 +17,49 @@ import yaml
 
 VERSION = "2.0.3"
 
+# Webhook 配置项：(环境变量名/配置键, 配置文件中的键)
+WEBHOOK_CONFIG_KEYS = (
+    ("FEISHU_WEBHOOK_URL", "feishu_url"),
+    ("DINGTALK_WEBHOOK_URL", "dingtalk_url"),
+    ("WEWORK_WEBHOOK_URL", "wework_url"),
+    ("TELEGRAM_BOT_TOKEN", "telegram_bot_token"),
+    ("TELEGRAM_CHAT_ID", "telegram_chat_id"),
+)
+
+# 优先使用 libyaml 的 C 解析器，未安装时回退到纯 Python 实现
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 请求头内容固定，定义为模块常量，避免每次请求重复构建
+VERSION_CHECK_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/plain, */*",
+    "Cache-Control": "no-cache",
+}
+
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+}
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# newsnow 接口中表示数据可用的响应状态
+VALID_RESPONSE_STATUSES = frozenset({"success", "cache"})
+
 
 # === 配置管理 ===
 def load_config():
     """加载配置文件"""
     config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
 
-    if not Path(config_path).exists():
-        raise FileNotFoundError(f"配置文件 {config_path} 不存在")
-
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config_data = yaml.load(f, Loader=YAML_LOADER)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"配置文件 {config_path} 不存在") from None
 
     print(f"配置文件加载成功: {config_path}")
 
@@ -59,38 +91,24 @@ def load_config():
     notification = config_data.get("notification", {})
     webhooks = notification.get("webhooks", {})
 
-    config["FEISHU_WEBHOOK_URL"] = os.environ.get(
-        "FEISHU_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("feishu_url", "")
-    config["DINGTALK_WEBHOOK_URL"] = os.environ.get(
-        "DINGTALK_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("dingtalk_url", "")
-    config["WEWORK_WEBHOOK_URL"] = os.environ.get(
-        "WEWORK_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("wework_url", "")
-    config["TELEGRAM_BOT_TOKEN"] = os.environ.get(
-        "TELEGRAM_BOT_TOKEN", ""
-    ).strip() or webhooks.get("telegram_bot_token", "")
-    config["TELEGRAM_CHAT_ID"] = os.environ.get(
-        "TELEGRAM_CHAT_ID", ""
-    ).strip() or webhooks.get("telegram_chat_id", "")
+    # 每个环境变量只读取一次，同时记录配置来源
+    env_sources = {}
+    for config_key, file_key in WEBHOOK_CONFIG_KEYS:
+        env_value = os.environ.get(config_key, "").strip()
+        config[config_key] = env_value or webhooks.get(file_key, "")
+        env_sources[config_key] = "环境变量" if env_value else "配置文件"
 
     # 输出配置来源信息
     webhook_sources = []
     if config["FEISHU_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("FEISHU_WEBHOOK_URL") else "配置文件"
-        webhook_sources.append(f"飞书({source})")
+        webhook_sources.append(f"飞书({env_sources['FEISHU_WEBHOOK_URL']})")
     if config["DINGTALK_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("DINGTALK_WEBHOOK_URL") else "配置文件"
-        webhook_sources.append(f"钉钉({source})")
+        webhook_sources.append(f"钉钉({env_sources['DINGTALK_WEBHOOK_URL']})")
     if config["WEWORK_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("WEWORK_WEBHOOK_URL") else "配置文件"
-        webhook_sources.append(f"企业微信({source})")
+        webhook_sources.append(f"企业微信({env_sources['WEWORK_WEBHOOK_URL']})")
     if config["TELEGRAM_BOT_TOKEN"] and config["TELEGRAM_CHAT_ID"]:
-        token_source = (
-            "环境变量" if os.environ.get("TELEGRAM_BOT_TOKEN") else "配置文件"
-        )
-        chat_source = "环境变量" if os.environ.get("TELEGRAM_CHAT_ID") else "配置文件"
+        token_source = env_sources["TELEGRAM_BOT_TOKEN"]
+        chat_source = env_sources["TELEGRAM_CHAT_ID"]
         webhook_sources.append(f"Telegram({token_source}/{chat_source})")
 
     if webhook_sources:
@@ -108,9 +126,12 @@ print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
 
 
 # === 工具函数 ===
+BEIJING_TZ = pytz.timezone("Asia/Shanghai")
+
+
 def get_beijing_time():
     """获取北京时间"""
-    return datetime.now(pytz.timezone("Asia/Shanghai"))
+    return datetime.now(BEIJING_TZ)
 
 
 def format_date_folder():
@@ -123,14 +144,15 @@ def format_time_filename():
     return get_beijing_time().strftime("%H时%M分")
 
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 def clean_title(title: str) -> str:
     """清理标题中的特殊字符"""
     if not isinstance(title, str):
         title = str(title)
-    cleaned_title = title.replace("\n", " ").replace("\r", " ")
-    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
-    cleaned_title = cleaned_title.strip()
-    return cleaned_title
+    # \s 已包含换行符，一次替换即可完成清理
+    return WHITESPACE_PATTERN.sub(" ", title).strip()
 
 
 def ensure_directory_exists(directory: str):
@@ -146,23 +168,22 @@ def get_output_path(subfolder: str, filename: str) -> str:
     return str(output_dir / filename)
 
 
+def build_proxies(proxy_url: Optional[str]) -> Optional[Dict]:
+    """根据代理地址构建 requests 使用的 proxies 参数"""
+    if not proxy_url:
+        return None
+    return {"http": proxy_url, "https": proxy_url}
+
+
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """检查版本更新"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/plain, */*",
-            "Cache-Control": "no-cache",
-        }
+        proxies = build_proxies(proxy_url)
 
         response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
+            version_url, proxies=proxies, headers=VERSION_CHECK_HEADERS, timeout=10
         )
         response.raise_for_status()
 
@@ -190,16 +211,26 @@ def check_version_update(
         return False, None
 
 
-def is_first_crawl_today() -> bool:
-    """检测是否是当天第一次爬取"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+def get_today_txt_files() -> List[Path]:
+    """获取当天按时间排序的标题文件列表（目录不存在时返回空列表）"""
+    txt_dir = Path("output") / format_date_folder() / "txt"
 
-    if not txt_dir.exists():
-        return True
+    try:
+        with os.scandir(txt_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".txt") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+    return [txt_dir / name for name in sorted(names)]
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    return len(files) <= 1
+
+def is_first_crawl_today() -> bool:
+    """检测是否是当天第一次爬取"""
+    return len(get_today_txt_files()) <= 1
 
 
 def html_escape(text: str) -> str:
@@ -222,6 +253,8 @@ class DataFetcher:
 
     def __init__(self, proxy_url: Optional[str] = None):
         self.proxy_url = proxy_url
+        # 复用同一会话的连接池，所有平台请求同一主机，可省去重复的 TCP/TLS 握手
+        self.session = requests.Session()
 
     def fetch_data(
         self,
@@ -229,8 +262,8 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
-    ) -> Tuple[Optional[str], str, str]:
-        """获取指定ID数据，支持重试"""
+    ) -> Tuple[Optional[Dict], str, str]:
+        """获取指定ID数据，支持重试，返回已解析的JSON数据"""
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
@@ -239,43 +272,32 @@ class DataFetcher:
 
         url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
-            "Cache-Control": "no-cache",
-        }
+        proxies = build_proxies(self.proxy_url)
 
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
+                response = self.session.get(
+                    url, proxies=proxies, headers=FETCH_HEADERS, timeout=10
                 )
                 response.raise_for_status()
 
-                data_text = response.text
-                data_json = json.loads(data_text)
+                data_json = response.json()
 
                 status = data_json.get("status", "未知")
-                if status not in ["success", "cache"]:
+                if status not in VALID_RESPONSE_STATUSES:
                     raise ValueError(f"响应状态异常: {status}")
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
-                return data_text, id_value, alias
+                return data_json, id_value, alias
 
             except Exception as e:
                 retries += 1
                 if retries <= max_retries:
+                    # 指数退避 + 随机抖动，成功时直接返回不等待
                     base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = base_wait * (2 ** (retries - 1))
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
                     time.sleep(wait_time)
                 else:
@@ -301,11 +323,10 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
+            data, _, _ = self.fetch_data(id_info)
 
-            if response:
+            if data:
                 try:
-                    data = json.loads(response)
                     results[id_value] = {}
                     for index, item in enumerate(data.get("items", []), 1):
                         title = item["title"]
@@ -320,9 +341,6 @@ class DataFetcher:
                                 "url": url,
                                 "mobileUrl": mobile_url,
                             }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
                 except Exception as e:
                     print(f"处理 {id_value} 数据出错: {e}")
                     failed_ids.append(id_value)
@@ -389,21 +407,21 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
     return file_path
 
 
+@lru_cache(maxsize=None)
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
+    """加载频率词配置（同一次运行内只读取解析一次）"""
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
         )
 
-    frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
-        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
-
-    with open(frequency_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    try:
+        with open(frequency_file, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在") from None
 
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
@@ -479,10 +497,11 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
                         title_part = line.strip()
                         rank = None
 
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
+                        # 提取排名（只在第一个 ". " 处切分一次）
+                        rank_str, sep, rest = title_part.partition(". ")
+                        if sep and rank_str.isdigit():
                             rank = int(rank_str)
+                            title_part = rest
 
                         # 提取 MOBILE URL
                         mobile_url = ""
@@ -517,29 +536,30 @@ def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
     """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
+    files = get_today_txt_files()
+    if not files:
         return {}, {}, {}
 
+    # 平台列表转为集合，逐个来源过滤时按哈希查找
+    platform_filter = (
+        set(current_platform_ids) if current_platform_ids is not None else None
+    )
+
     all_results = {}
     final_id_to_name = {}
     title_info = {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-
     for file_path in files:
         time_info = file_path.stem
 
         titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-        if current_platform_ids is not None:
+        if platform_filter is not None:
             filtered_titles_by_id = {}
             filtered_id_to_name = {}
 
             for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
+                if source_id in platform_filter:
                     filtered_titles_by_id[source_id] = title_data
                     if source_id in file_id_to_name:
                         filtered_id_to_name[source_id] = file_id_to_name[source_id]
@@ -632,25 +652,24 @@ def process_source_data(
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
     """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        return {}
-
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    files = get_today_txt_files()
     if len(files) < 2:
         return {}
 
+    # 平台列表转为集合，逐个来源过滤时按哈希查找
+    platform_filter = (
+        set(current_platform_ids) if current_platform_ids is not None else None
+    )
+
     # 解析最新文件
     latest_file = files[-1]
     latest_titles, _ = parse_file_titles(latest_file)
 
     # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
+    if platform_filter is not None:
         filtered_latest_titles = {}
         for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
+            if source_id in platform_filter:
                 filtered_latest_titles[source_id] = title_data
         latest_titles = filtered_latest_titles
 
@@ -660,18 +679,15 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
         historical_data, _ = parse_file_titles(file_path)
 
         # 过滤历史数据
-        if current_platform_ids is not None:
+        if platform_filter is not None:
             filtered_historical_data = {}
             for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
+                if source_id in platform_filter:
                     filtered_historical_data[source_id] = title_data
             historical_data = filtered_historical_data
 
         for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
+            historical_titles.setdefault(source_id, set()).update(titles_data)
 
     # 找出新增标题
     new_titles = {}
@@ -726,6 +742,14 @@ def calculate_news_weight(
     return total_weight
 
 
+@lru_cache(maxsize=None)
+def compile_filter_pattern(filter_words: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """将过滤词编译为单个正则，一次扫描完成全部过滤词检查"""
+    if not filter_words:
+        return None
+    return re.compile("|".join(re.escape(word.lower()) for word in filter_words))
+
+
 def matches_word_groups(
     title: str, word_groups: List[Dict], filter_words: List[str]
 ) -> bool:
@@ -737,7 +761,8 @@ def matches_word_groups(
     title_lower = title.lower()
 
     # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
+    filter_pattern = compile_filter_pattern(tuple(filter_words))
+    if filter_pattern and filter_pattern.search(title_lower):
         return False
 
     # 词组匹配检查
@@ -776,6 +801,16 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
+# 各平台排名高亮标记：(开始标记, 结束标记)，未列出的平台使用 Markdown 加粗
+RANK_HIGHLIGHT_MARKERS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+}
+
+
 def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
     """统一的排名格式化方法"""
     if not ranks:
@@ -785,24 +820,9 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
     min_rank = unique_ranks[0]
     max_rank = unique_ranks[-1]
 
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    else:
-        highlight_start = "**"
-        highlight_end = "**"
+    highlight_start, highlight_end = RANK_HIGHLIGHT_MARKERS.get(
+        format_type, ("**", "**")
+    )
 
     if min_rank <= rank_threshold:
         if min_rank == max_rank:
@@ -1325,12 +1345,6 @@ def format_title_for_platform(
         return result
 
     elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
-        )
-
-        link_url = title_data["mobile_url"] or title_data["url"]
-
         escaped_title = html_escape(cleaned_title)
         escaped_source_name = html_escape(title_data["source_name"])
 
@@ -1387,13 +1401,16 @@ def generate_html_report(
         report_data, total_titles, is_daily_summary, mode
     )
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # 只编码一次，报告文件和根目录 index.html 直接写入同一份字节
+    html_bytes = html_content.encode("utf-8")
+
+    with open(file_path, "wb") as f:
+        f.write(html_bytes)
 
     if is_daily_summary:
         root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        with open(root_file_path, "wb") as f:
+            f.write(html_bytes)
 
     return file_path
 
@@ -1987,6 +2004,14 @@ def render_html_content(
     return html
 
 
+# 各模式下无匹配结果时的提示文本
+EMPTY_RESULT_TEXTS = {
+    "incremental": "增量模式下暂无新增匹配的热点词汇",
+    "current": "当前榜单模式下暂无匹配的热点词汇",
+}
+DEFAULT_EMPTY_RESULT_TEXT = "暂无匹配的热点词汇"
+
+
 def render_feishu_content(
     report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
 ) -> str:
@@ -2023,17 +2048,15 @@ def render_feishu_content(
         if i < len(report_data["stats"]) - 1:
             text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
 
-    if not text_content:
-        if mode == "incremental":
-            mode_text = "增量模式下暂无新增匹配的热点词汇"
-        elif mode == "current":
-            mode_text = "当前榜单模式下暂无匹配的热点词汇"
-        else:
-            mode_text = "暂无匹配的热点词汇"
+    # 记录是否有词频内容，后续据此决定是否添加分隔符，无需反复扫描全文
+    has_stats_content = bool(text_content)
+
+    if not has_stats_content:
+        mode_text = EMPTY_RESULT_TEXTS.get(mode, DEFAULT_EMPTY_RESULT_TEXT)
         text_content = f"📭 {mode_text}\n\n"
 
     if report_data["new_titles"]:
-        if text_content and "暂无匹配" not in text_content:
+        if has_stats_content:
             text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
 
         text_content += (
@@ -2056,7 +2079,7 @@ def render_feishu_content(
             text_content += "\n"
 
     if report_data["failed_ids"]:
-        if text_content and "暂无匹配" not in text_content:
+        if has_stats_content:
             text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
 
         text_content += "⚠️ **数据获取失败的平台：**\n\n"
@@ -2122,16 +2145,11 @@ def render_dingtalk_content(
                 text_content += f"\n---\n\n"
 
     if not report_data["stats"]:
-        if mode == "incremental":
-            mode_text = "增量模式下暂无新增匹配的热点词汇"
-        elif mode == "current":
-            mode_text = "当前榜单模式下暂无匹配的热点词汇"
-        else:
-            mode_text = "暂无匹配的热点词汇"
+        mode_text = EMPTY_RESULT_TEXTS.get(mode, DEFAULT_EMPTY_RESULT_TEXT)
         text_content += f"📭 {mode_text}\n\n"
 
     if report_data["new_titles"]:
-        if text_content and "暂无匹配" not in text_content:
+        if report_data["stats"]:
             text_content += f"\n---\n\n"
 
         text_content += (
@@ -2152,7 +2170,7 @@ def render_dingtalk_content(
             text_content += "\n"
 
     if report_data["failed_ids"]:
-        if text_content and "暂无匹配" not in text_content:
+        if report_data["stats"]:
             text_content += f"\n---\n\n"
 
         text_content += "⚠️ **数据获取失败的平台：**\n\n"
@@ -2213,12 +2231,7 @@ def split_content_into_batches(
         and not report_data["new_titles"]
         and not report_data["failed_ids"]
     ):
-        if mode == "incremental":
-            mode_text = "增量模式下暂无新增匹配的热点词汇"
-        elif mode == "current":
-            mode_text = "当前榜单模式下暂无匹配的热点词汇"
-        else:
-            mode_text = "暂无匹配的热点词汇"
+        mode_text = EMPTY_RESULT_TEXTS.get(mode, DEFAULT_EMPTY_RESULT_TEXT)
         simple_content = f"📭 {mode_text}\n\n"
         final_content = base_header + simple_content + base_footer
         batches.append(final_content)
@@ -2521,36 +2534,37 @@ def send_to_webhooks(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    common_args = (report_data, report_type, update_info_to_send, proxy_url, mode)
+    senders = {}
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        senders["feishu"] = (send_to_feishu, (feishu_url, *common_args))
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        senders["dingtalk"] = (send_to_dingtalk, (dingtalk_url, *common_args))
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        senders["wework"] = (send_to_wework, (wework_url, *common_args))
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
-            telegram_token,
-            telegram_chat_id,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+        senders["telegram"] = (
+            send_to_telegram,
+            (telegram_token, telegram_chat_id, *common_args),
         )
 
+    # 各平台互不依赖，并发发送，总耗时取决于最慢的平台（含分批发送间隔）
+    if senders:
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            futures = {
+                name: executor.submit(func, *args)
+                for name, (func, args) in senders.items()
+            }
+        results = {name: future.result() for name, future in futures.items()}
+
     if not results:
         print("未配置任何webhook URL，跳过通知发送")
 
@@ -2566,7 +2580,7 @@ def send_to_feishu(
     mode: str = "daily",
 ) -> bool:
     """发送到飞书"""
-    headers = {"Content-Type": "application/json"}
+    headers = JSON_HEADERS
 
     text_content = render_feishu_content(report_data, update_info, mode)
     total_titles = sum(
@@ -2584,9 +2598,7 @@ def send_to_feishu(
         },
     }
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    proxies = build_proxies(proxy_url)
 
     try:
         response = requests.post(
@@ -2612,7 +2624,7 @@ def send_to_dingtalk(
     mode: str = "daily",
 ) -> bool:
     """发送到钉钉"""
-    headers = {"Content-Type": "application/json"}
+    headers = JSON_HEADERS
 
     text_content = render_dingtalk_content(report_data, update_info, mode)
 
@@ -2624,9 +2636,7 @@ def send_to_dingtalk(
         },
     }
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    proxies = build_proxies(proxy_url)
 
     try:
         response = requests.post(
@@ -2657,10 +2667,8 @@ def send_to_wework(
     mode: str = "daily",
 ) -> bool:
     """发送到企业微信（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    headers = JSON_HEADERS
+    proxies = build_proxies(proxy_url)
 
     # 获取分批内容
     batches = split_content_into_batches(report_data, "wework", update_info, mode=mode)
@@ -2720,12 +2728,10 @@ def send_to_telegram(
     mode: str = "daily",
 ) -> bool:
     """发送到Telegram（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
+    headers = JSON_HEADERS
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    proxies = build_proxies(proxy_url)
 
     # 获取分批内容
     batches = split_content_into_batches(
@@ -2821,6 +2827,9 @@ class NewsAnalyzer:
         self.request_interval = CONFIG["REQUEST_INTERVAL"]
         self.report_mode = CONFIG["REPORT_MODE"]
         self.rank_threshold = CONFIG["RANK_THRESHOLD"]
+        self.current_platform_ids = [
+            platform["id"] for platform in CONFIG["PLATFORMS"]
+        ]
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
         self.update_info = None
@@ -2833,16 +2842,11 @@ class NewsAnalyzer:
 
     def _detect_docker_environment(self) -> bool:
         """检测是否运行在 Docker 容器中"""
-        try:
-            if os.environ.get("DOCKER_CONTAINER") == "true":
-                return True
-
-            if os.path.exists("/.dockerenv"):
-                return True
+        if os.environ.get("DOCKER_CONTAINER") == "true":
+            return True
 
-            return False
-        except Exception:
-            return False
+        # os.path.exists 遇到 OSError 时自身返回 False，无需额外捕获异常
+        return os.path.exists("/.dockerenv")
 
     def _should_open_browser(self) -> bool:
         """判断是否应该打开浏览器"""
@@ -2911,15 +2915,10 @@ class NewsAnalyzer:
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
         """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
         try:
-            # 获取当前配置的监控平台ID列表
-            current_platform_ids = []
-            for platform in CONFIG["PLATFORMS"]:
-                current_platform_ids.append(platform["id"])
-
-            print(f"当前监控平台: {current_platform_ids}")
+            print(f"当前监控平台: {self.current_platform_ids}")
 
             all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
+                self.current_platform_ids
             )
 
             if not all_results:
@@ -2929,7 +2928,7 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
+            new_titles = detect_latest_new_titles(self.current_platform_ids)
             word_groups, filter_words = load_frequency_words()
 
             return (
@@ -3014,12 +3013,10 @@ class NewsAnalyzer:
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
         has_webhook = self._has_webhook_configured()
+        # 内容检查只做一次，后续分支复用结果
+        has_valid_content = self._has_valid_content(stats, new_titles)
 
-        if (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_webhook
-            and self._has_valid_content(stats, new_titles)
-        ):
+        if CONFIG["ENABLE_NOTIFICATION"] and has_webhook and has_valid_content:
             send_to_webhooks(
                 stats,
                 failed_ids or [],
@@ -3035,11 +3032,7 @@ class NewsAnalyzer:
             print("⚠️ 警告：通知功能已启用但未配置webhook URL，将跳过通知发送")
         elif not CONFIG["ENABLE_NOTIFICATION"]:
             print(f"跳过{report_type}通知：通知功能已禁用")
-        elif (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_webhook
-            and not self._has_valid_content(stats, new_titles)
-        ):
+        elif CONFIG["ENABLE_NOTIFICATION"] and has_webhook and not has_valid_content:
             mode_strategy = self._get_mode_strategy()
             if "实时" in report_type:
                 print(
@@ -3093,13 +3086,18 @@ class NewsAnalyzer:
 
         return html_file
 
-    def _generate_summary_html(self, mode: str = "daily") -> Optional[str]:
-        """生成汇总HTML"""
+    def _generate_summary_html(
+        self,
+        mode: str = "daily",
+        analysis_data: Optional[Tuple[Dict, Dict, Dict, Dict, List, List]] = None,
+    ) -> Optional[str]:
+        """生成汇总HTML，可复用本次运行已加载的分析数据"""
         summary_type = "当前榜单汇总" if mode == "current" else "当日汇总"
         print(f"生成{summary_type}HTML...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        if analysis_data is None:
+            analysis_data = self._load_analysis_data()
         if not analysis_data:
             return None
 
@@ -3143,7 +3141,7 @@ class NewsAnalyzer:
         print(f"报告模式: {self.report_mode}")
         print(f"运行模式: {mode_strategy['description']}")
 
-    def _crawl_data(self) -> Tuple[Dict, Dict, List]:
+    def _crawl_data(self) -> Tuple[Dict, Dict, List, str]:
         """执行数据爬取"""
         ids = []
         for platform in CONFIG["PLATFORMS"]:
@@ -3165,18 +3163,23 @@ class NewsAnalyzer:
         title_file = save_titles_to_file(results, id_to_name, failed_ids)
         print(f"标题已保存到: {title_file}")
 
-        return results, id_to_name, failed_ids
+        # 本次抓取统一使用保存时的时间标记，避免重复保存产生时间偏差
+        time_info = Path(title_file).stem
+
+        return results, id_to_name, failed_ids, time_info
 
     def _execute_mode_strategy(
-        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+        self,
+        mode_strategy: Dict,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        time_info: str,
     ) -> Optional[str]:
         """执行模式特定逻辑"""
-        # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
+        new_titles = detect_latest_new_titles(self.current_platform_ids)
         word_groups, filter_words = load_frequency_words()
+        analysis_data = None
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -3212,7 +3215,6 @@ class NewsAnalyzer:
                 print(f"HTML报告已生成: {html_file}")
 
                 # 发送实时通知（使用完整历史数据的统计结果）
-                summary_html = None
                 if mode_strategy["should_send_realtime"]:
                     self._send_notification_if_needed(
                         stats,
@@ -3240,7 +3242,6 @@ class NewsAnalyzer:
             print(f"HTML报告已生成: {html_file}")
 
             # 发送实时通知（如果需要）
-            summary_html = None
             if mode_strategy["should_send_realtime"]:
                 self._send_notification_if_needed(
                     stats,
@@ -3257,7 +3258,7 @@ class NewsAnalyzer:
             if mode_strategy["should_send_realtime"]:
                 # 如果已经发送了实时通知，汇总只生成HTML不发送通知
                 summary_html = self._generate_summary_html(
-                    mode_strategy["summary_mode"]
+                    mode_strategy["summary_mode"], analysis_data
                 )
             else:
                 # daily模式：直接生成汇总报告并发送通知
@@ -3265,6 +3266,8 @@ class NewsAnalyzer:
 
         # 打开浏览器（仅在非容器环境）
         if self._should_open_browser() and html_file:
+            import webbrowser
+
             if summary_html:
                 summary_url = "file://" + str(Path(summary_html).resolve())
                 print(f"正在打开汇总报告: {summary_url}")
@@ -3288,9 +3291,11 @@ class NewsAnalyzer:
 
             mode_strategy = self._get_mode_strategy()
 
-            results, id_to_name, failed_ids = self._crawl_data()
+            results, id_to_name, failed_ids, time_info = self._crawl_data()
 
-            self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
+            self._execute_mode_strategy(
+                mode_strategy, results, id_to_name, failed_ids, time_info
+            )
 
         except Exception as e:
             print(f"分析流程执行出错: {e}")
@@ -3302,11 +3307,13 @@ def main():
         analyzer = NewsAnalyzer()
         analyzer.run()
     except FileNotFoundError as e:
-        print(f"❌ 配置文件错误: {e}")
-        print("\n请确保以下文件存在:")
-        print("  • config/config.yaml")
-        print("  • config/frequency_words.txt")
-        print("\n参考项目文档进行正确配置")
+        print(
+            f"❌ 配置文件错误: {e}\n"
+            "\n请确保以下文件存在:\n"
+            "  • config/config.yaml\n"
+            "  • config/frequency_words.txt\n"
+            "\n参考项目文档进行正确配置"
+        )
     except Exception as e:
         print(f"❌ 程序运行错误: {e}")
         raise